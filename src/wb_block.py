@@ -1343,6 +1343,7 @@ class WbBlackBox(WbObject):
         sp4 = 4 * " "
         sp8 = 8 * " "
         res = "\nclass " + self.name + "(agwb.Block):\n"
+        res += sp4 + "__slots__ = ()\n"
         res += sp4 + "x__is_blackbox = True\n"
         res += sp4 + "x__size = " + str(self.addr_size) + "\n"
         res += sp4 + "x__fields = {\n"
@@ -2321,6 +2322,7 @@ end {p_entity}_wb_map_pkg;
         sp4 = 4 * " "
         sp8 = 8 * " "
         res = "\nclass " + self.name + "(agwb.Block):\n"
+        res += sp4 + "__slots__ = ()\n"
         res += sp4 + "x__size = " + str(self.addr_size) + "\n"
         res += sp4 + "x__id = " + hex(self.id_val) + "\n"
         if nvar is None:
@@ -38,50 +38,77 @@ rmw(self,address=none,mask=0,value=0) - schedules the read-modify-write
 dispatch() - executes the accumulated list of operations
       (the list may be executed automatically, if it grows
       to its full possible length).
+
+The block transfers to vectors of registers require
+the interface to provide the following methods:
+
+read_block(self,address,count) - that returns the sequence
+       of 32-bit values read from "count" consecutive addresses
+       (e.g. a list or a numpy array)
+write_block(self,address,values) - that writes the values to
+       the consecutive addresses
 """
 
-class BitField(object):
+from collections import namedtuple
+
+class BitField(
+    namedtuple("BitField", "mask shift sign_mask vmin vmax inv_mask width_mask lsb msb")
+):
     """Class delivering an object used to describe the bitfield.
 
     Its fields contain certain precalculated values supporting quick
     handling of read and write access to the field.
     That class does not provide any methods.
     Only fields are used.
+    The object is a named tuple, so it does not need the instance dictionary.
     """
 
-    def __init__(self, msb:int, lsb:int, is_signed:bool) -> None:
-        self.lsb = lsb
-        self.msb = msb
+    __slots__ = ()
+
+    def __new__(cls, msb:int, lsb:int, is_signed:bool):
         if is_signed:
-            self.sign_mask = 1 << (msb - lsb)
-            self.vmin = -self.sign_mask
-            self.vmax = self.sign_mask - 1
+            sign_mask = 1 << (msb - lsb)
+            vmin = -sign_mask
+            vmax = sign_mask - 1
         else:
-            self.vmin = 0
-            self.vmax = (1 << (msb - lsb + 1)) - 1
-            self.sign_mask = 0
-        self.mask = ((1 << (msb + 1)) - 1) ^ ((1 << lsb) - 1)
+            vmin = 0
+            vmax = (1 << (msb - lsb + 1)) - 1
+            sign_mask = 0
+        mask = ((1 << (msb + 1)) - 1) ^ ((1 << lsb) - 1)
+        # Values used directly in the read and write methods
+        inv_mask = ~mask & 0xFFFFFFFF
+        width_mask = (1 << (msb - lsb + 1)) - 1
+        return super().__new__(
+            cls, mask, lsb, sign_mask, vmin, vmax, inv_mask, width_mask, lsb, msb
+        )
+
+    def __getnewargs__(self):
+        return (self.msb, self.lsb, self.sign_mask != 0)
 
 class _BitFieldFuture(object):
     """Class enabling delayed access to the value read from the bitfield
     """
+
+    __slots__ = ("rfut", "bf", "_cached", "_done")
+
     def __init__(self, rfut, bf) -> None:
         self.rfut = rfut
         self.bf = bf
-
-    def __getattr__(self,name):
-        try:
-            if name == "val":
-                rval = self.rfut.val & self.bf.mask
-                rval >>= self.bf.lsb
-                if self.bf.sign_mask:
-                    if rval & self.bf.sign_mask:
-                        rval -= self.bf.sign_mask << 1
-                return rval
-            else:
-                raise Exception("Only val field is available")
-        except KeyError as ke:
-            return object.__getattribute__(self,name)
+        self._cached = None
+        self._done = False
+
+    @property
+    def val(self):
+        """The value of the bitfield. It is calculated on the first access."""
+        if self._done:
+            return self._cached
+        bf = self.bf
+        sign_mask = bf.sign_mask
+        # Extract the bitfield and extend its sign (no-op if sign_mask is 0)
+        rval = (((self.rfut.val & bf.mask) >> bf.shift) ^ sign_mask) - sign_mask
+        self._cached = rval
+        self._done = True
+        return rval
 
 
 class _BitFieldAccess(object):
@@ -91,6 +118,8 @@ class _BitFieldAccess(object):
     BitField object passed via bf argument.
     """
 
+    __slots__ = ("x__iface", "x__base", "x__bf")
+
     def __init__(self, iface, base, bf):
         self.x__iface = iface
         self.x__base = base
@@ -101,13 +130,11 @@ class _BitFieldAccess(object):
             The read is performed immediately, the result is
             masked, shifted and returned as integer.
         """
+        bf = self.x__bf
+        sign_mask = bf.sign_mask
         rval = self.x__iface.read(self.x__base)
-        rval &= self.x__bf.mask
-        rval >>= self.x__bf.lsb
-        if self.x__bf.sign_mask:
-            if rval & self.x__bf.sign_mask:
-                rval -= self.x__bf.sign_mask << 1
-        return rval
+        # Extract the bitfield and extend its sign (no-op if sign_mask is 0)
+        return (((rval & bf.mask) >> bf.shift) ^ sign_mask) - sign_mask
 
     def write(self, value):
         """ Simple write method. Does not use any access optimization.
@@ -115,23 +142,17 @@ class _BitFieldAccess(object):
             Please note, that access to each bitfield generates
             a strobe pulse for the whole register (if strobe is implemented).
         """
+        bf = self.x__bf
         # Check if the value to be stored is correct
-        if (value < self.x__bf.vmin) or (value > self.x__bf.vmax):
+        if (value < bf.vmin) or (value > bf.vmax):
             raise Exception("Value doesn't fit in the bitfield")
-        # If the bitfield is signed, convert the negative values
-        if self.x__bf.sign_mask:
-            if value < 0:
-                value += self.x__bf.sign_mask << 1
-                print("final value: " + str(value))
-        # Read the whole register
-        rval = self.x__iface.read(self.x__base)
-        # Mask the bitfield
-        rval &= ~self.x__bf.mask
-        # Shift the new value
-        value = value << self.x__bf.lsb
-        value &= self.x__bf.mask
-        rval |= value
-        self.x__iface.write(self.x__base, rval)
+        # Masking with width_mask also converts the negative values
+        # of signed bitfields
+        value = (value & bf.width_mask) << bf.shift
+        iface = self.x__iface
+        base = self.x__base
+        # Read the whole register, replace the bitfield and write it back
+        iface.write(base, (iface.read(base) & bf.inv_mask) | value)
 
     def readx(self):
         """ Optimized read method. Schedules reading of the register.
@@ -154,29 +175,32 @@ class _BitFieldAccess(object):
             register is executed, the write is scheduled with current
             mask and value, resulting from rmws aggregated up to now.
         """
+        bf = self.x__bf
         # Check if the value to be stored is correct
-        if (value < self.x__bf.vmin) or (value > self.x__bf.vmax):
+        if (value < bf.vmin) or (value > bf.vmax):
             raise Exception("Value doesn't fit in the bitfield")
-        # If the bitfield is signed, convert the negative values
-        if self.x__bf.sign_mask:
-            if value < 0:
-                value += self.x__bf.sign_mask << 1
-                print("final value: " + str(value))
-        # Calculate the shifted value
-        value = value << self.x__bf.lsb
+        # Calculate the shifted value. Masking with width_mask also
+        # converts the negative values of signed bitfields
+        value = (value & bf.width_mask) << bf.shift
+        iface = self.x__iface
         # Schedule the RMW operation
-        self.x__iface.rmw(self.x__base, self.x__bf.mask, value)
+        iface.rmw(self.x__base, bf.mask, value)
         # If now is true, finalize the current RMW
         if now:
-            self.x__iface.rmw()
+            iface.rmw()
 
 class Vector(object):
     """Class describing the vector of registers or subblocks.
 
-    It provides only a __getitem__ method that allows to access the particular object
-    in a vector (the object is created on the fly, when it is needed).
+    It provides a __getitem__ method that allows to access the particular object
+    in a vector (the object is created on the fly, when it is needed, and then
+    reused in the subsequent accesses).
+    Vectors of registers additionally support block transfers
+    (read_range and write_range methods).
     """
 
+    __slots__ = ("iface", "base", "mclass", "args", "nitems", "items", "make")
+
     def __init__(self, iface, base, nitems, margs):
         self.iface = iface
         self.base = base
@@ -185,23 +209,137 @@ class Vector(object):
         if len(margs) > 1:
             self.args = margs[1]
         self.nitems = nitems
+        self.items = nitems * [None]
+        # Function creating the item with the given index
+        mclass = self.mclass
+        stride = mclass.x__size
+        if self.args is not None:
+            args = self.args
+            self.make = lambda key: mclass(iface, base + key * stride, args)
+        else:
+            self.make = lambda key: mclass(iface, base + key * stride)
 
     def __getitem__(self, key):
         if isinstance(key,slice):
             return [self[i] for i in range(*key.indices(len(self)))]
-        if key < 0:
-            key = self.nitems + key
-        if key >= self.nitems:
-            raise IndexError
-        if self.args != None:
-            return self.mclass(
-                self.iface, self.base + key * self.mclass.x__size, self.args
-            )
-        return self.mclass(self.iface, self.base + key * self.mclass.x__size)
+        # Indexing of the items list checks the range of key
+        obj = self.items[key]
+        if obj is None:
+            if key < 0:
+                key = self.nitems + key
+            obj = self.make(key)
+            self.items[key] = obj
+        return obj
 
     def __len__(self):
         return self.nitems
 
+    def read_range(self, start, stop):
+        """ Block read method for vectors of registers.
+            The registers with indices from start to stop-1 are read
+            with a single read_block call of the interface.
+            IndexError is raised unless 0 <= start <= stop <= len(self).
+        """
+        if not issubclass(self.mclass, _Register):
+            raise Exception("Block transfers are supported only for vectors of registers")
+        if not 0 <= start <= stop <= self.nitems:
+            raise IndexError
+        return self.iface.read_block(self.base + start, stop - start)
+
+    def write_range(self, start, values):
+        """ Block write method for vectors of registers.
+            The values are written to the registers with indices
+            starting from start, with a single write_block call of the interface.
+            IndexError is raised unless 0 <= start <= start + len(values) <= len(self).
+        """
+        if not issubclass(self.mclass, _Register):
+            raise Exception("Block transfers are supported only for vectors of registers")
+        if issubclass(self.mclass, StatusRegister):
+            raise Exception("Status registers at " + hex(self.base) + " can't be written")
+        if not 0 <= start <= start + len(values) <= self.nitems:
+            raise IndexError
+        self.iface.write_block(self.base + start, values)
+
+def _bitfields_class(rclass, bfields):
+    """Returns the subclass of the register class rclass,
+    providing the bitfields described in bfields as properties.
+
+    The subclasses are created once and cached, so all registers
+    sharing the same bitfields description use the same class.
+    """
+    key = (rclass, id(bfields))
+    try:
+        return _bitfields_classes[key]
+    except KeyError:
+        pass
+    attrs = {"__slots__": ()}
+    for name, bf in bfields.items():
+        if hasattr(rclass, name):
+            continue
+        attrs[name] = property(_cached_getter(
+            name, lambda iface, base, bf=bf: _BitFieldAccess(iface, base, bf)
+        ))
+    bclass = type(rclass.__name__, (rclass,), attrs)
+    # Keep the reference to bfields, so that its id can't be reused
+    bclass.x__bfields_desc = bfields
+    _bitfields_classes[key] = bclass
+    return bclass
+
+_bitfields_classes = {}
+
+def _cached_getter(name, make):
+    """Returns the getter of the property returning the object
+    created by make(iface, base).
+
+    The object is created on the first access and stored in the
+    x__cache dictionary of the parent object.
+    """
+    def getter(self):
+        obj = self.x__cache.get(name)
+        if obj is None:
+            obj = make(self.x__iface, self.x__base)
+            self.x__cache[name] = obj
+        return obj
+    return getter
+
+def _field_accessors(fields):
+    """Returns the dictionary of getters providing access to the objects
+    described by the x__fields dictionary fields.
+
+    The source of the getters is generated for the particular block class,
+    with the offsets of the fields embedded as constants, and compiled once.
+    """
+    env = {"Vector": Vector}
+    src = ""
+    names = {}
+    for i, (name, f_i) in enumerate(fields.items()):
+        if hasattr(Block, name):
+            continue
+        offset = hex(f_i[0])
+        if len(f_i) == 3:
+            margs = f_i[2]
+            if len(margs) > 1:
+                margs = (_bitfields_class(margs[0], margs[1]), margs[1])
+            env["m" + str(i)] = margs
+            make = "Vector(self.x__iface, self.x__base + " + offset + ", " + str(f_i[1]) + ", m" + str(i) + ")"
+        elif len(f_i[1]) == 1:
+            env["c" + str(i)] = f_i[1][0]
+            make = "c" + str(i) + "(self.x__iface, self.x__base + " + offset + ")"
+        else:
+            # pass addititional argument to the constructor
+            env["c" + str(i)] = _bitfields_class(f_i[1][0], f_i[1][1])
+            env["a" + str(i)] = f_i[1][1]
+            make = "c" + str(i) + "(self.x__iface, self.x__base + " + offset + ", a" + str(i) + ")"
+        src += "def f" + str(i) + "(self):\n"
+        src += "    obj = self.x__cache.get(" + repr(name) + ")\n"
+        src += "    if obj is None:\n"
+        src += "        obj = " + make + "\n"
+        src += "        self.x__cache[" + repr(name) + "] = obj\n"
+        src += "    return obj\n"
+        names[name] = "f" + str(i)
+    exec(src, env)
+    return {name: env[fname] for name, fname in names.items()}
+
 class Block(object):
     """Class describing the blocks handled by addr_gen_wb-generated code.
 
@@ -209,32 +347,35 @@ class Block(object):
     corresponding to subblocks or registers.
     """
 
+    __slots__ = ("x__base", "x__iface", "x__variant", "x__cache")
+
     x__is_blackbox:bool = False
     x__size:int = 1
     x__fields:dict = {}
 
+    def __init_subclass__(cls, **kwargs):
+        """Creates the properties providing access to the fields
+        of the derived class.
+
+        The x__fields dictionary is analyzed only once, when the class
+        is created, so access to the subblocks and registers does not
+        need to go through __getattr__.
+        """
+        super().__init_subclass__(**kwargs)
+        if "x__fields" in cls.__dict__:
+            for name, getter in _field_accessors(cls.x__fields).items():
+                setattr(cls, name, property(getter))
+
     def __init__(self, iface, base, variant = None):
         """base is the base address for the given block. """
         self.x__base = base
         self.x__iface = iface
         self.x__variant = variant
+        self.x__cache = {}
 
     def __dir__(self):
         return self.x__fields.keys()
 
-    def __getattr__(self, name):
-        try:
-            f_i = self.x__fields[name]
-            if len(f_i) == 3:
-                return Vector(self.x__iface, self.x__base + f_i[0], f_i[1], f_i[2])
-            elif len(f_i) == 2:
-                if len(f_i[1]) == 1:
-                    return f_i[1][0](self.x__iface, self.x__base + f_i[0])
-                # pass addititional argument to the constructor
-                return f_i[1][0](self.x__iface, self.x__base + f_i[0], f_i[1][1])
-        except KeyError as ke:
-            return object.__getattribute__(self,name)
-
 
     def _verify_id(self):
         id = self.ID.read()
@@ -258,10 +399,18 @@ class Block(object):
         It raises the exception if read values differ as it indicates,
         that software and firmware versions differ.
         """
-        for k in self.x__fields.keys():
-            subblock = getattr(self, k)
-            if not issubclass(type(subblock), Block):
+        for k, f_i in self.x__fields.items():
+            # Only the non black box subblocks are checked,
+            # so the registers do not need to be created
+            mclass = f_i[-1][0]
+            if not issubclass(mclass, Block) or mclass.x__is_blackbox:
                 continue
+            subblock = getattr(self, k)
+            if len(f_i) == 3:
+                for item in subblock[:]:
+                    item.verify_id_and_version()
+            else:
+                subblock.verify_id_and_version()
 
         if self.x__is_blackbox == False:
             self._verify_id()
@@ -271,7 +420,13 @@ class Block(object):
         self.x__iface.dispatch()
 
 class _Register(object):
-    """Base class supporting access to the register."""
+    """Base class supporting access to the register.
+
+    The registers created by the Block objects are instances of subclasses
+    providing the bitfields as properties (see _bitfields_class).
+    """
+
+    __slots__ = ("x__iface", "x__base", "x__bfields", "x__cache")
 
     x__size = 1
 
@@ -279,6 +434,7 @@ class _Register(object):
         self.x__iface = iface
         self.x__base = base
         self.x__bfields = bfields
+        self.x__cache = {}
 
     def __dir__(self):
         return self.x__bfields.keys()
@@ -319,7 +475,7 @@ class _Register(object):
         self.x__iface.writex(self.x__base, value)
 
     def write_fifo(self, values):
-        self.x__iface.write(self.x__base, values)
+        self.x__iface.write_fifo(self.x__base, values)
 
     def rmw(self, mask, value, now=True):
         """ Optimized read-modify-write method. Multiple rmw commands
@@ -340,9 +496,14 @@ class _Register(object):
 
     def __getattr__(self, name):
         try:
-            return _BitFieldAccess(self.x__iface, self.x__base, self.x__bfields[name])
+            bf = self.x__bfields[name]
         except KeyError as ke:
             return object.__getattribute__(self,name)
+        obj = self.x__cache.get(name)
+        if obj is None:
+            obj = _BitFieldAccess(self.x__iface, self.x__base, bf)
+            self.x__cache[name] = obj
+        return obj
 
 
 
@@ -355,6 +516,8 @@ class StatusRegister(_Register):
     The write methods throws an exception.
     """
 
+    __slots__ = ()
+
     def write(self, value):
         raise Exception("Status register at " + hex(self.x__base) + " can't be written")
 
@@ -371,121 +534,285 @@ Please remember that in the real solution the functionality will be split
 into two parts: in the HW backend, and in the gateway application.
 """
 if __name__ == "__main__":
+    from array import array
+    import logging as log
+    # The accesses done by the demo interface are logged with debug level
+    # log.basicConfig(level=log.DEBUG)
+
     # Table emulating the register file
-    rf = 1024 * [
-        int(0),
-    ]
+    try:
+        import numpy as np
+        rf = np.zeros(1024, dtype=np.uint32)
+    except ImportError:
+        # numpy is not required by the demo, the list works as well
+        rf = 1024 * [
+            int(0),
+        ]
+
+    # Kinds of scheduled operations
+    OP_READ = 0
+    OP_WRITE = 1
+    OP_RMW = 2
+    # Maximum number of scheduled operations. When it is achieved,
+    # the operations are dispatched automatically.
+    MAX_OPERS = 64
+
+    def rmw_value(dval, mask, nval):
+        """The real HW implemented RMW, working only on integers"""
+        return (dval & ~mask) | nval
 
     # The class iface provides just two methods
     # read(address) and write(address,value)
     class DemoIface(object):
-        def __init__(self):
-            self.opers = [] # List of operations
-            self.rmw_df = None # Future object for current RMW
+        __slots__ = (
+            "kinds", "addrs", "masks", "vals", "fut_idx", "_n", "futures", "_nf",
+            "rmw_fi", "_rmw_pending", "rmw_addr", "rmw_mask", "rmw_nval", "_fut_pool",
+            "coalesce",
+        )
+
+        def __init__(self, coalesce=False):
+            self._alloc()
+            self.coalesce = coalesce # Remove the overwritten writes before dispatch
+            self.rmw_fi = None # Index of the future object for current RMW
+            self._rmw_pending = False # True if an aggregated RMW is not finalized yet
             self.rmw_addr = None # RMW address for aggregated RMW commands
             self.rmw_mask = 0 # Mask for the aggregated RMW commands
             self.rmw_nval = 0 # Value for the aggregated RMW commands
-            pass
+            self._fut_pool = [] # Future objects available for reuse
 
         class DI_future(object):
+            __slots__ = ("iface", "done", "_val", "released")
+
             def __init__(self,iface):
                 self.iface = iface
                 self.done = False
                 self._val = None
-            def __getattr__(self,name):
-                try:
-                    if name == "val":
-                        # Check if the transaction is executed
-                        if self.done:
-                            return self._val
-                        else:
-                            self.iface.dispatch()
-                            if self.done:
-                                return self._val
-                            else:
-                                raise Exception("val not set after dispatch!")
-                except KeyError as ke:
-                    return object.__getattribute__(self,name)
+                self.released = False # True if the future is in the pool
+
+            @property
+            def val(self):
+                # Check if the transaction is executed
+                if self.done:
+                    return self._val
+                self.iface.dispatch()
+                if self.done:
+                    return self._val
+                raise Exception("val not set after dispatch!")
 
             def set(self, val):
                 self.done = True
                 self._val = val
 
-        def read(self, addr):
-            self.rmw() # Finalize any pending RMW
-            if self.opers:
+            def release(self):
+                # Return the future to the pool, when its value is not needed anymore
+                if self.released:
+                    raise Exception("The future is already released")
+                if not self.done:
+                    raise Exception("The future can't be released before its read is executed")
+                self.released = True
+                self.iface._fut_pool.append(self)
+
+        def _alloc(self):
+            # Scheduled operations, stored as preallocated parallel arrays
+            self.kinds = array("B", MAX_OPERS * [0]) # Kinds of operations
+            self.addrs = array("I", MAX_OPERS * [0]) # Addresses
+            self.masks = array("I", MAX_OPERS * [0]) # Masks (for RMW)
+            self.vals = array("I", MAX_OPERS * [0]) # Values (for write and RMW)
+            self.fut_idx = array("i", MAX_OPERS * [0]) # Indices of the futures (for read and RMW)
+            self._n = 0 # Number of scheduled operations
+            # Futures of the scheduled reads (one more is needed for the pending RMW)
+            self.futures = (MAX_OPERS + 1) * [None]
+            self._nf = 0 # Number of futures
+
+        def _schedule(self, kind, addr, mask, val, fi):
+            n = self._n
+            self.kinds[n] = kind
+            self.addrs[n] = addr
+            self.masks[n] = mask
+            self.vals[n] = val
+            self.fut_idx[n] = fi
+            n += 1
+            self._n = n
+            if n == MAX_OPERS:
                 self.dispatch()
+
+        def _new_future(self):
+            # Create the future for the scheduled read and return its index
+            nf = self._nf
+            if self._fut_pool:
+                df = self._fut_pool.pop()
+                df.done = False
+                df._val = None
+                df.released = False
+            else:
+                df = self.DI_future(self)
+            self.futures[nf] = df
+            self._nf = nf + 1
+            return nf
+
+        def _coalesce(self):
+            # Remove the scheduled writes overwritten by a write to the same
+            # address scheduled directly after them.
+            # Please note, that it reduces the number of strobe pulses
+            # generated for the register, so it must be enabled explicitly.
+            kinds = self.kinds
+            addrs = self.addrs
+            masks = self.masks
+            vals = self.vals
+            fut_idx = self.fut_idx
+            n = self._n
+            j = 0
+            for i in range(n):
+                kind = kinds[i]
+                addr = addrs[i]
+                if kind == OP_WRITE and i + 1 < n and kinds[i + 1] == OP_WRITE and addrs[i + 1] == addr:
+                    continue
+                if i != j:
+                    kinds[j] = kind
+                    addrs[j] = addr
+                    masks[j] = masks[i]
+                    vals[j] = vals[i]
+                    fut_idx[j] = fut_idx[i]
+                j += 1
+            self._n = j
+
+        def _flush(self):
+            # Finalize any pending RMW and execute the scheduled operations
+            if self._rmw_pending:
+                self.rmw()
+            self.dispatch()
+
+        def read(self, addr):
+            if self._rmw_pending or self._n:
+                self._flush()
             return self._read(addr)
 
         def _read(self, addr):
             global rf
-            print("reading from address:" + hex(addr) + " val=" + hex(rf[addr]))
-            return rf[addr]
+            val = int(rf[addr])
+            log.debug("reading from address:0x%x val=0x%x", addr, val)
+            return val
 
         def write(self, addr, val):
-            self.rmw() # Finalize any pending RMW
-            if self.opers:
-                self.dispatch()
+            if self._rmw_pending or self._n:
+                self._flush()
             self._write(addr,val)
 
         def _write(self, addr, val):
             global rf
-            print("writing " + hex(val) + " to address " + hex(addr))
-            rf[addr] = val
+            log.debug("writing 0x%x to address 0x%x", val, addr)
+            rf[addr] = val & 0xFFFFFFFF
+
+        def read_fifo(self, addr, count):
+            if self._rmw_pending or self._n:
+                self._flush()
+            return [self._read(addr) for i in range(count)]
+
+        def write_fifo(self, addr, vals):
+            if self._rmw_pending or self._n:
+                self._flush()
+            for val in vals:
+                self._write(addr, val)
+
+        def read_block(self, addr, count):
+            if self._rmw_pending or self._n:
+                self._flush()
+            return self._read_block(addr, count)
+
+        def _read_block(self, addr, count):
+            global rf
+            log.debug("reading %d words from address:0x%x", count, addr)
+            return rf[addr:addr + count].copy()
+
+        def write_block(self, addr, vals):
+            if self._rmw_pending or self._n:
+                self._flush()
+            self._write_block(addr, vals)
+
+        def _write_block(self, addr, vals):
+            global rf
+            log.debug("writing %d words to address 0x%x", len(vals), addr)
+            # Store 32-bit words, like _write does
+            if isinstance(rf, list):
+                rf[addr:addr + len(vals)] = [val & 0xFFFFFFFF for val in vals]
+            else:
+                rf[addr:addr + len(vals)] = np.asarray(vals) & 0xFFFFFFFF
 
         def writex(self, addr, val):
-            self.rmw() # Finalize any pending RMW
-            self.opers.append(lambda : self._write(addr, val))
+            if self._rmw_pending:
+                self.rmw() # Finalize any pending RMW
+            # The operation arrays store 32-bit words, like _write does
+            self._schedule(OP_WRITE, addr, 0, val & 0xFFFFFFFF, -1)
 
         def readx(self, addr):
-            self.rmw() # Finalize any pending RMW
-            df = self.DI_future(self)
-            self.opers.append(lambda : df.set(self._read(addr)))
+            if self._rmw_pending:
+                self.rmw() # Finalize any pending RMW
+            fi = self._new_future()
+            df = self.futures[fi]
+            self._schedule(OP_READ, addr, 0, 0, fi)
             return df
 
-        def _rmw(self, df, addr, mask, nval):
-            # The real HW implemented RMW
-            dval = df.val & ~mask
-            dval |= nval
-            self._write(addr, dval)
-
         def rmw(self, addr=None, mask=0, val=0):
             # Call to RMW without arguments simply finalizes the last RMW
             # Check if another RMW is being prepared
-            if (self.rmw_addr is not None) and (addr != self.rmw_addr):
+            if self._rmw_pending and (addr != self.rmw_addr):
                 # Finalize the previous RMW
-                # We must copy the values, as they may be overwritten at the time of execution!
-                odf = self.rmw_df
-                mask = self.rmw_mask
-                waddr = self.rmw_addr
-                nval = self.rmw_nval
-                self.opers.append(lambda : self._rmw(odf, waddr, mask, nval))
+                self._schedule(OP_RMW, self.rmw_addr, self.rmw_mask, self.rmw_nval, self.rmw_fi)
                 self.rmw_addr = None
-                self.rmw_df = None
+                self.rmw_fi = None
+                self.rmw_mask = 0
+                self.rmw_nval = 0
+                self._rmw_pending = False
             if addr is not None:
                 # Schedule reading of the initial value of the register
-                if self.rmw_addr is None:
-                    df = self.DI_future(self)
-                    self.opers.append(lambda : df.set(self._read(addr)))
-                    self.rmw_df = df
+                if not self._rmw_pending:
+                    fi = self._new_future()
+                    self.rmw_fi = fi
                     self.rmw_addr = addr
+                    self._rmw_pending = True
+                    self._schedule(OP_READ, addr, 0, 0, fi)
                 # Now aggregate the current operation
+                mask &= 0xFFFFFFFF
+                self.rmw_nval = (self.rmw_nval & ~mask) | (val & mask)
                 self.rmw_mask |= mask
-                self.rmw_nval &= ~mask
-                self.rmw_nval |= (val & mask)
 
         def dispatch(self):
-            if not self.opers:
-                print("empty dispatch")
+            if not self._n:
+                log.debug("empty dispatch")
                 return
-            print("before dispatch")
-            for x in self.opers:
-                x()
-            self.opers = []
-            print("after dispatch")
+            log.debug("before dispatch")
+            if self.coalesce:
+                self._coalesce()
+            kinds = self.kinds
+            addrs = self.addrs
+            masks = self.masks
+            vals = self.vals
+            fut_idx = self.fut_idx
+            futures = self.futures
+            for i in range(self._n):
+                kind = kinds[i]
+                if kind == OP_READ:
+                    futures[fut_idx[i]].set(self._read(addrs[i]))
+                elif kind == OP_WRITE:
+                    self._write(addrs[i], vals[i])
+                else:
+                    df = futures[fut_idx[i]]
+                    self._write(addrs[i], rmw_value(df.val, masks[i], vals[i]))
+                    # The future of RMW is used only internally, so it may be reused
+                    df.released = True
+                    self._fut_pool.append(df)
+            self._n = 0
+            self._nf = 0
+            if self._rmw_pending:
+                # Keep the future of the pending RMW, which will be finalized later
+                futures[0] = futures[self.rmw_fi]
+                self.rmw_fi = 0
+                self._nf = 1
+            log.debug("after dispatch")
 
 
     class c2(Block):
+        __slots__ = ()
         x__size = 3
         x__fields = {
             "r1": (
@@ -498,6 +825,7 @@ if __name__ == "__main__":
         }
 
     class regs(Block):
+        __slots__ = ()
         x__size:int = 4
         x__fields:dict = {
            "rv" : (
@@ -509,8 +837,10 @@ if __name__ == "__main__":
         }
 
     class c1(Block):
+        __slots__ = ()
         x__size = 100
-        x__fields = {"f1": (0, 10, (c2,)), "f2": (11, (c2,)), "size": (32, (c2,)),"x1":(40,5,(regs,))}
+        x__fields = {"f1": (0, 10, (c2,)), "f2": (11, (c2,)), "size": (32, (c2,)),"x1":(40,5,(regs,)),
+                    "v1": (50, 4, (ControlRegister,))}
 
     mf = DemoIface()
     a = c1(mf, 12)
@@ -533,5 +863,14 @@ if __name__ == "__main__":
     p3 = a.x1[1].rv.readx()
     p4 = a.x1[3].rv.readx()
     print(p3.val,p4.val)
+    # The futures are not used anymore, so they may be reused
+    p3.release()
+    p4.release()
     print(a.f2.r1.t2.read())
     print(a.f2.r1.t1.read())
+    # Check if RMWs of two different registers do not interfere
+    a.f1[1].r1.t2.writex(11,False)
+    a.f1[2].r1.t1.writex(5,True)
+    print(a.f1[1].r1.t2.read(),a.f1[2].r1.t1.read()) # Should be 11 5
+    a.v1.write_range(0, [1, 2, 3, 4])
+    print(a.v1.read_range(1, 3))
@@ -246,10 +246,18 @@ class Block(object):
         It raises the exception if read values differ as it indicates,
         that software and firmware versions differ.
         """
-        for k in self.x__fields.keys():
-            subblock = getattr(self, k)
-            if not issubclass(type(subblock), Block):
+        for k, f_i in self.x__fields.items():
+            # Only the non black box subblocks are checked,
+            # so the registers do not need to be created
+            mclass = f_i[-1][0]
+            if not issubclass(mclass, Block) or mclass.x__is_blackbox:
                 continue
+            subblock = getattr(self, k)
+            if len(f_i) == 3:
+                for item in subblock[:]:
+                    item.verify_id_and_version()
+            else:
+                subblock.verify_id_and_version()
 
         if self.x__is_blackbox == False:
             self._verify_id()